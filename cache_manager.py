@@ -1,22 +1,186 @@
 import sqlite3
 import json
-from typing import Optional, Any
+import sys
+import atexit
+import queue
+import threading
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Any, Tuple
 import logging
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Memory-map up to 256 MB of the database so cache hits are served from the
+# kernel page cache; 32-bit processes get a smaller window to spare address space.
+_MMAP_SIZE = 268435456 if sys.maxsize > 2**32 else 33554432
+
+# Per-connection tuning; journal_mode=WAL is persisted in the database file itself.
+_CONNECTION_PRAGMAS = f"""
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-8000;
+    PRAGMA mmap_size={_MMAP_SIZE};
+"""
+
+# Maximum number of translations memoized in-process in front of SQLite.
+_MEMO_SIZE = 2048
+
+# Most queued cache writes committed together by the background writer.
+_WRITE_BATCH_SIZE = 128
+
+# Size of each connection's prepared-statement cache.
+_CACHED_STATEMENTS = 256
+
+# Preference values of these types are stored natively in SQLite; anything
+# else (dicts, lists, ...) is JSON-encoded and tagged as 'json'.
+_NATIVE_PREFERENCE_TYPES = {str: 'str', int: 'int', float: 'float'}
+_PREFERENCE_DECODERS = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': lambda value: bool(int(value)),
+    'none': lambda value: None,
+}
+
+def _normalize_source(text: str) -> str:
+    """Canonical cache key for a source text: NFC-composed Hangul, no surrounding whitespace."""
+    return unicodedata.normalize("NFC", text).strip()
+
+def _encode_preference(value: Any) -> Tuple[Any, str]:
+    """Return the (stored value, type tag) pair for a preference value."""
+    if value is None:
+        return None, 'none'
+    if isinstance(value, bool):
+        return int(value), 'bool'
+    type_tag = _NATIVE_PREFERENCE_TYPES.get(type(value))
+    if type_tag == 'int' and not -2**63 <= value < 2**63:
+        # Too large for a SQLite integer; its JSON text still decodes exactly with int()
+        return str(value), type_tag
+    if type_tag is not None:
+        return value, type_tag
+    return _json_dumps(value), 'json'
+
+def _decode_preference(value: Any, type_tag: Optional[str]) -> Any:
+    """Inverse of _encode_preference; untagged rows predate the type column."""
+    decoder = _PREFERENCE_DECODERS.get(type_tag)
+    if decoder is None:
+        return _json_loads(value)
+    return decoder(value)
+
+def _configure(conn: sqlite3.Connection) -> None:
+    """Apply the per-connection PRAGMAs that are not persisted on disk."""
+    conn.executescript(_CONNECTION_PRAGMAS)
+
+class _Pool:
+    """A single read-write connection plus a bounded set of read-only connections."""
+
+    def __init__(self, db_path: str, max_readers: int = 4):
+        self._write_lock = threading.Lock()
+        self._writer = sqlite3.connect(db_path, check_same_thread=False,
+                                       isolation_level=None,
+                                       cached_statements=_CACHED_STATEMENTS)
+        _configure(self._writer)
+        self._reader_uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._max_readers = max_readers
+        self._opened_readers = 0
+        self._open_lock = threading.Lock()
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the read-write connection exclusively."""
+        with self._write_lock:
+            yield self._writer
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, opening one lazily if the pool has room."""
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._open_lock:
+            if self._opened_readers < self._max_readers:
+                conn = sqlite3.connect(self._reader_uri, uri=True,
+                                       check_same_thread=False,
+                                       cached_statements=_CACHED_STATEMENTS)
+                _configure(conn)
+                self._opened_readers += 1
+                return conn
+        return self._readers.get()
+
+    def close(self) -> None:
+        """Close the writer and every idle reader connection."""
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            self._writer.close()
+
 class CacheManager:
+    # Hot-path statements live in one place so each pooled connection compiles
+    # them once and then serves them from its prepared-statement cache.
+    _INSERT_TRANSLATION_SQL = """
+        INSERT OR REPLACE INTO translations
+        (source_text, translated_text, source_lang, target_lang)
+        VALUES (?, ?, ?, ?)
+    """
+    _SELECT_TRANSLATION_SQL = """
+        SELECT translated_text FROM translations INDEXED BY idx_trans_lookup
+        WHERE source_text = ? AND source_lang = ? AND target_lang = ?
+    """
+    _INSERT_PREFERENCE_SQL = """
+        INSERT OR REPLACE INTO preferences (key, value, type)
+        VALUES (?, ?, ?)
+    """
+    _SELECT_PREFERENCE_SQL = "SELECT value, type FROM preferences WHERE key = ?"
+
     def __init__(self, db_path: str = "translation_cache.db"):
         self.db_path = db_path
+        self._pool: Optional[_Pool] = _Pool(self.db_path)
+        # Bounded LRU of (source_text, source_lang, target_lang) -> translation,
+        # so repeated lookups within a session skip SQLite entirely.
+        self._memo: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._memo_lock = threading.Lock()
         self._init_db()
+        # cache_translation only enqueues; a single writer thread commits the
+        # rows so callers on the GUI thread never wait on disk I/O.
+        self._write_q: "queue.Queue[Optional[Tuple[str, str, str, str]]]" = queue.Queue()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        atexit.register(self.close)
 
     def _init_db(self) -> None:
         """Initialize the SQLite database with required tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
+            with self._pool.write() as conn:
+                # Only takes effect for a brand-new database, so it must precede
+                # the first CREATE TABLE (and the switch to WAL).
+                conn.execute("PRAGMA page_size=8192")
+                conn.execute("""
                     CREATE TABLE IF NOT EXISTS translations (
                         source_text TEXT PRIMARY KEY,
                         translated_text TEXT,
@@ -25,48 +189,116 @@ class CacheManager:
                         timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
-                
-                cursor.execute("""
+
+                # Covering index for get_cached_translation: the lookup is answered
+                # from the index B-tree alone, without a second fetch from the table.
+                # The planner would otherwise prefer the unique source_text index,
+                # so _SELECT_TRANSLATION_SQL names it explicitly with INDEXED BY.
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_trans_lookup
+                    ON translations (source_lang, target_lang, source_text, translated_text)
+                """)
+
+                conn.execute("""
                     CREATE TABLE IF NOT EXISTS preferences (
                         key TEXT PRIMARY KEY,
-                        value TEXT,
+                        value BLOB,
+                        type TEXT,
                         timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
-                conn.commit()
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(preferences)")}
+                if 'type' not in columns:
+                    conn.execute("ALTER TABLE preferences ADD COLUMN type TEXT")
+
+                # WAL lets readers proceed alongside a writer and turns each commit
+                # into a sequential append instead of a rollback-journal rewrite.
+                conn.execute("PRAGMA journal_mode=WAL")
         except sqlite3.Error as e:
             logger.error(f"Database initialization error: {str(e)}")
             raise
 
+    def _remember(self, key: Tuple[str, str, str], translated_text: str) -> None:
+        """Insert a translation into the in-process LRU, evicting the oldest entry."""
+        with self._memo_lock:
+            self._memo[key] = translated_text
+            self._memo.move_to_end(key)
+            if len(self._memo) > _MEMO_SIZE:
+                self._memo.popitem(last=False)
+
+    def _writer_loop(self) -> None:
+        """Drain queued cache writes, committing each burst in a single transaction."""
+        stop = False
+        while not stop:
+            rows = [self._write_q.get()]
+            while len(rows) < _WRITE_BATCH_SIZE:
+                try:
+                    rows.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            if None in rows:
+                stop = True
+            try:
+                self.cache_translations_bulk(row for row in rows if row is not None)
+            except sqlite3.Error:
+                pass  # Already logged; the rows stay available from the memo
+            finally:
+                for _ in rows:
+                    self._write_q.task_done()
+
     def cache_translation(self, source_text: str, translated_text: str,
                          source_lang: str = 'ko', target_lang: str = 'en') -> None:
-        """Store a translation in the cache."""
+        """Store a translation in the cache; the background writer persists it."""
+        source_text = _normalize_source(source_text)
+        self._remember((source_text, source_lang, target_lang), translated_text)
+        self._write_q.put((source_text, translated_text, source_lang, target_lang))
+
+    def flush(self) -> None:
+        """Block until every queued cache write has been committed."""
+        self._write_q.join()
+
+    def cache_translations_bulk(self, rows: Iterable[Tuple[str, str, str, str]]) -> None:
+        """Store many (source_text, translated_text, source_lang, target_lang) rows in one transaction."""
+        rows = [(_normalize_source(source_text), translated_text, source_lang, target_lang)
+                for source_text, translated_text, source_lang, target_lang in rows]
+        if not rows:
+            return
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO translations 
-                    (source_text, translated_text, source_lang, target_lang)
-                    VALUES (?, ?, ?, ?)
-                """, (source_text, translated_text, source_lang, target_lang))
-                conn.commit()
+            with self._pool.write() as conn:
+                conn.execute("BEGIN")
+                try:
+                    conn.executemany(self._INSERT_TRANSLATION_SQL, rows)
+                    conn.execute("COMMIT")
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK")
+                    raise
         except sqlite3.Error as e:
             logger.error(f"Error caching translation: {str(e)}")
             raise
+        for source_text, translated_text, source_lang, target_lang in rows:
+            self._remember((source_text, source_lang, target_lang), translated_text)
 
     def get_cached_translation(self, source_text: str,
                              source_lang: str = 'ko',
                              target_lang: str = 'en') -> Optional[str]:
         """Retrieve a cached translation if available."""
+        source_text = _normalize_source(source_text)
+        key = (source_text, source_lang, target_lang)
+        with self._memo_lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+                return cached
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT translated_text FROM translations
-                    WHERE source_text = ? AND source_lang = ? AND target_lang = ?
-                """, (source_text, source_lang, target_lang))
-                result = cursor.fetchone()
-                return result[0] if result else None
+            with self._pool.read() as conn:
+                result = conn.execute(
+                    self._SELECT_TRANSLATION_SQL, (source_text, source_lang, target_lang)
+                ).fetchone()
+            if result is None:
+                return None
+            self._remember(key, result[0])
+            return result[0]
         except sqlite3.Error as e:
             logger.error(f"Error retrieving cached translation: {str(e)}")
             return None
@@ -74,13 +306,8 @@ class CacheManager:
     def save_preference(self, key: str, value: Any) -> None:
         """Save a user preference."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO preferences (key, value)
-                    VALUES (?, ?)
-                """, (key, json.dumps(value)))
-                conn.commit()
+            with self._pool.write() as conn:
+                conn.execute(self._INSERT_PREFERENCE_SQL, (key, *_encode_preference(value)))
         except sqlite3.Error as e:
             logger.error(f"Error saving preference: {str(e)}")
             raise
@@ -88,34 +315,42 @@ class CacheManager:
     def get_preference(self, key: str, default: Any = None) -> Any:
         """Retrieve a user preference."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT value FROM preferences WHERE key = ?", (key,))
-                result = cursor.fetchone()
-                return json.loads(result[0]) if result else default
+            with self._pool.read() as conn:
+                result = conn.execute(self._SELECT_PREFERENCE_SQL, (key,)).fetchone()
+            return _decode_preference(*result) if result else default
         except sqlite3.Error as e:
             logger.error(f"Error retrieving preference: {str(e)}")
             return default
 
     def clear_cache(self, older_than_days: Optional[int] = None) -> None:
         """Clear the translation cache, optionally only entries older than specified days."""
+        self.flush()
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._pool.write() as conn:
                 if older_than_days is not None:
-                    cursor.execute("""
+                    conn.execute("""
                         DELETE FROM translations
                         WHERE julianday('now') - julianday(timestamp) > ?
                     """, (older_than_days,))
                 else:
-                    cursor.execute("DELETE FROM translations")
-                conn.commit()
+                    conn.execute("DELETE FROM translations")
+            with self._memo_lock:
+                self._memo.clear()
         except sqlite3.Error as e:
             logger.error(f"Error clearing cache: {str(e)}")
             raise
 
+    def close(self) -> None:
+        """Flush pending writes and close all pooled database connections."""
+        if self._pool is None:
+            return
+        self._write_q.put(None)
+        self._writer_thread.join()
+        self._pool.close()
+        self._pool = None
+
 # Example usage
 if __name__ == "__main__":
     cache = CacheManager()
     cache.save_preference("default_source_lang", "ko")
-    print(f"Saved preference: {cache.get_preference('default_source_lang')}") 
\ No newline at end of file
+    print(f"Saved preference: {cache.get_preference('default_source_lang')}")
@@ -1,8 +1,13 @@
 import logging
+import re
 from typing import Dict, List
 
 logger = logging.getLogger(__name__)
 
+# Common honorific markers, matched in a single pass by one compiled alternation
+_HONORIFIC_MARKERS = ['님', '씨', '께서', '하세요', '입니다']
+_HONORIFIC_RE = re.compile("|".join(map(re.escape, _HONORIFIC_MARKERS)))
+
 class KoreanProcessor:
     def __init__(self):
         pass
@@ -19,11 +24,9 @@ class KoreanProcessor:
             'formal_speech': [],
             'cultural_terms': []
         }
-        
+
         # Simple string matching for common honorific markers
-        honorific_markers = ['님', '씨', '께서', '하세요', '입니다']
-        for marker in honorific_markers:
-            if marker in text:
-                cultural_markers['honorifics'].append(marker)
-                
-        return cultural_markers 
\ No newline at end of file
+        found = set(_HONORIFIC_RE.findall(text))
+        cultural_markers['honorifics'] = [marker for marker in _HONORIFIC_MARKERS if marker in found]
+
+        return cultural_markers
@@ -1,8 +1,9 @@
 import sys
 import logging
+from functools import partial
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QThread, pyqtSignal
-from translator_ui import TranslatorWindow, TranslationWorker
+from PyQt6.QtCore import Qt, QThread, QThreadPool, pyqtSignal
+from translator_ui import TranslatorWindow, TranslationRunnable, WordTranslationRunnable
 from model_setup import TranslationModel
 from korean_processor import KoreanProcessor
 from cache_manager import CacheManager
@@ -32,6 +33,13 @@ class TranslatorApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.window = TranslatorWindow()
+        # One long-lived worker thread runs translations and word lookups in FIFO
+        # order; it is created on first use and never expires, so no thread is
+        # started per request
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)
+        self.app.aboutToQuit.connect(self.shutdown_workers, Qt.ConnectionType.DirectConnection)
         self.setup_components()
         self.connect_signals()
 
@@ -51,8 +59,8 @@ class TranslatorApp:
             logger.info(f"Using device: {device}")
             
             self.model_loader = ModelLoader(self.translation_model, device)
-            self.model_loader.finished.connect(self.on_model_loaded)
-            self.model_loader.error.connect(self.on_model_load_error)
+            self.model_loader.finished.connect(self.on_model_loaded, Qt.ConnectionType.QueuedConnection)
+            self.model_loader.error.connect(self.on_model_load_error, Qt.ConnectionType.QueuedConnection)
             self.model_loader.start()
             
             # Load preferences
@@ -81,8 +89,8 @@ class TranslatorApp:
     def connect_signals(self):
         """Connect UI signals to handlers."""
         widget = self.window.translator_widget
-        widget.translation_requested.connect(self.handle_translation_request)
-        widget.word_translation_requested.connect(self.handle_word_translation)
+        widget.translation_requested.connect(self.handle_translation_request, Qt.ConnectionType.DirectConnection)
+        widget.word_translation_requested.connect(self.handle_word_translation, Qt.ConnectionType.DirectConnection)
 
     def handle_translation_request(self, text: str, source_lang: str, target_lang: str):
         """Handle translation requests."""
@@ -107,18 +115,24 @@ class TranslatorApp:
                 self.window.translator_widget.show_loading("Translating...")
 
             # Create and start translation worker
-            logger.info("Creating translation worker thread")
-            self.translation_worker = TranslationWorker(
+            logger.info("Creating translation worker")
+            self.translation_worker = TranslationRunnable(
                 self.translation_model, text, source_lang, target_lang
             )
-            self.translation_worker.finished.connect(
-                lambda translation: self.handle_translation_complete(
-                    translation, text, source_lang, target_lang
-                )
+            # The signals are emitted from a pool thread
+            signals = self.translation_worker.signals
+            signals.finished.connect(
+                partial(self.handle_translation_complete, source_text=text,
+                        source_lang=source_lang, target_lang=target_lang),
+                Qt.ConnectionType.QueuedConnection
             )
-            self.translation_worker.error.connect(self.handle_translation_error)
-            logger.info("Starting translation worker thread")
-            self.translation_worker.start()
+            signals.partial.connect(
+                partial(self.handle_translation_chunk, target_lang=target_lang),
+                Qt.ConnectionType.QueuedConnection
+            )
+            signals.error.connect(self.handle_translation_error, Qt.ConnectionType.QueuedConnection)
+            logger.info("Starting translation worker")
+            self._pool.start(self.translation_worker)
 
         except Exception as e:
             logger.error(f"Translation error in request handler: {str(e)}")
@@ -128,6 +142,11 @@ class TranslatorApp:
                 target_lang
             )
 
+    def handle_translation_chunk(self, chunk: str, target_lang: str):
+        """Show streamed translation output as soon as it is generated."""
+        self.window.translator_widget.hide_loading()
+        self.window.translator_widget.append_translation_chunk(chunk, target_lang)
+
     def handle_translation_complete(self, translation: str, source_text: str, 
                                   source_lang: str, target_lang: str):
         """Handle completed translation."""
@@ -155,21 +174,38 @@ class TranslatorApp:
 
     def handle_word_translation(self, word: str, context: str):
         """Handle word translation requests."""
-        try:
-            # Get both direct and contextual translations
-            translations = self.translation_model.translate_word(word, context)
-            
-            # Show translations in tooltip
-            self.window.translator_widget.show_word_translation(translations)
-            
-        except Exception as e:
-            logger.error(f"Word translation error: {str(e)}")
-            # Show error in tooltip
-            self.window.translator_widget.show_word_translation({
-                "word": word,
-                "direct_translation": "Translation error",
-                "contextual_translation": str(e)
-            })
+        # Runs on the pool thread so generate() never blocks the GUI thread
+        self.word_worker = WordTranslationRunnable(self.translation_model, word, context)
+        signals = self.word_worker.signals
+        signals.finished.connect(
+            partial(self.handle_word_translation_complete, word, context), Qt.ConnectionType.QueuedConnection
+        )
+        signals.error.connect(
+            partial(self.handle_word_translation_error, word), Qt.ConnectionType.QueuedConnection
+        )
+        self._pool.start(self.word_worker)
+
+    def handle_word_translation_complete(self, word: str, context: str, translations: dict):
+        """Handle a completed word translation."""
+        self.window.translator_widget.remember_word_translation(word, context, translations)
+
+        # Show translations in tooltip
+        self.window.translator_widget.show_word_translation(translations)
+
+    def handle_word_translation_error(self, word: str, error_msg: str):
+        """Handle word translation error."""
+        logger.error(f"Word translation error: {error_msg}")
+        # Show error in tooltip
+        self.window.translator_widget.show_word_translation({
+            "word": word,
+            "direct_translation": "Translation error",
+            "contextual_translation": error_msg
+        })
+
+    def shutdown_workers(self):
+        """Drop queued translations and wait for the running one before exiting."""
+        self._pool.clear()
+        self._pool.waitForDone()
 
     def run(self):
         """Run the application."""
@@ -1,164 +1,376 @@
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from transformers import (AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig,
+                          CompileConfig, GenerationConfig, StoppingCriteria,
+                          StoppingCriteriaList, TextStreamer)
 import torch
-from typing import Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
+import contextlib
+import copy
+import gc
+import importlib.util
 import logging
 import threading
 import time
-from queue import Queue
+
+_SYSTEM_KO_EN = (
+    "You are EXAONE model from LG AI Research. "
+    "You are a professional Korean to English translator. "
+    "Translate the following Korean text to natural, fluent English. "
+    "Maintain the original meaning and nuance."
+)
+_SYSTEM_EN_KO = (
+    "You are EXAONE model from LG AI Research. "
+    "You are a professional English to Korean translator. "
+    "Translate the following English text to natural, fluent Korean. "
+    "Maintain the original meaning and nuance."
+)
+_SYSTEM_GENERIC = (
+    "You are EXAONE model from LG AI Research. "
+    "Translate the following text appropriately while maintaining "
+    "the original meaning and nuance."
+)
+_SYSTEM_WORD_DIRECT = "You are EXAONE model from LG AI Research. Provide a direct word-for-word translation."
+_SYSTEM_WORD_CONTEXT = (
+    "You are EXAONE model from LG AI Research. "
+    "Explain how this word is used in the given context and provide its contextual meaning."
+)
+
+# translate(direction=...) values, "<source>2<target>", mapped to their system prompts
+_DIRECTIONS = {
+    "ko2en": _SYSTEM_KO_EN,
+    "en2ko": _SYSTEM_EN_KO,
+}
+
+# Legacy direction markers at the start of the text, for callers that pass no direction
+_PREFIX_TABLE = (
+    ("Translate this Korean text to English:", _SYSTEM_KO_EN),
+    ("Translate this English text to Korean:", _SYSTEM_EN_KO),
+)
+
+# Supported TranslationModel(quantization=...) values
+_QUANTIZATION_MODES = ("nf4", "int8", None)
+
+# Fixed generation budgets. With a static cache the compiled decode step is
+# captured as a CUDA graph per cache shape, so these must not vary per request.
+_MAX_NEW_TOKENS = 256
+_RETRY_MAX_NEW_TOKENS = 128
+_WORD_MAX_NEW_TOKENS = 32
+
+# Warm-up user message, long enough that the static cache allocated during
+# warm-up already fits typical requests and is reused rather than regrown
+_WARM_UP_TEXT = "Hello " * 200
+
+# Stand-in user message used to split the rendered chat template around the user turn
+_USER_PLACEHOLDER = "<<USER_TEXT>>"
 
 class TimeoutException(Exception):
-    pass
+    def __init__(self, message: str = "", partial=None):
+        super().__init__(message)
+        # Generation output (sequences and KV cache) produced before the deadline
+        self.partial = partial
+
+class _Deadline(StoppingCriteria):
+    """Stopping criterion that ends generation between decode steps once a deadline passes."""
+
+    def __init__(self, timeout_seconds: float):
+        self.deadline = time.monotonic() + timeout_seconds
+        self.expired = False
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        if not self.expired and time.monotonic() > self.deadline:
+            self.expired = True
+        return torch.full((input_ids.shape[0],), self.expired, dtype=torch.bool, device=input_ids.device)
+
+class _CallbackStreamer(TextStreamer):
+    """TextStreamer that hands each decoded chunk to a callback and keeps the chunks."""
+
+    def __init__(self, tokenizer, on_text: Callable[[str], None]):
+        super().__init__(tokenizer, skip_prompt=True, skip_special_tokens=True)
+        self._on_text = on_text
+        self.chunks: List[str] = []
+
+    def on_finalized_text(self, text: str, stream_end: bool = False):
+        if text:
+            self.chunks.append(text)
+            self._on_text(text)
 
 class TranslationModel:
-    def __init__(self, model_name: str = "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct"):
+    def __init__(self, model_name: str = "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct",
+                 quantization: Optional[str] = "nf4"):
+        if quantization not in _QUANTIZATION_MODES:
+            raise ValueError(f"Unsupported quantization: {quantization!r}")
         self.model_name = model_name
+        # "nf4" (4-bit), "int8" or None for unquantized bfloat16 weights
+        self.quantization = quantization
         self.model = None
         self.tokenizer = None
         self.logger = logging.getLogger(__name__)
-        
+        # Generation configs are fixed once the tokenizer is known, so they are
+        # built a single time in load_model instead of on every request.
+        self._gen_cfg_sample: Optional[GenerationConfig] = None
+        self._gen_cfg_greedy: Optional[GenerationConfig] = None
+        self._gen_cfg_word: Optional[GenerationConfig] = None
+        # Set to "static" when the decode step is compiled for CUDA
+        self._cache_implementation: Optional[str] = None
+        self._compile_config: Optional[CompileConfig] = None
+        # system prompt -> (ids before the user text, ids after it)
+        self._prompt_ids: Dict[str, Tuple[torch.Tensor, torch.Tensor]] = {}
+        # system prompt -> KV cache of its template prefix, computed on first use
+        self._prefix_kv: Dict[str, object] = {}
+        # Serializes generate() calls while they share the compiled model's StaticCache
+        self._generate_lock = threading.Lock()
+
     def load_model(self, device: Optional[str] = None) -> None:
         """Load the model and tokenizer with specified configurations."""
         try:
             self.logger.info(f"Loading model: {self.model_name}")
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, trust_remote_code=True)
-            self.model = AutoModelForCausalLM.from_pretrained(
-                self.model_name,
-                trust_remote_code=True,
-                revision="main",
-                torch_dtype=torch.bfloat16,
-                device_map="auto" if device is None else device,
-                low_cpu_mem_usage=True,
+            # Fast (Rust) tokenizer: chat-template encoding runs on every request
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self.model_name, trust_remote_code=True, use_fast=True
             )
+            if not self.tokenizer.is_fast:
+                self.logger.warning("No fast tokenizer available; falling back to the slow tokenizer")
+            attn_implementation = self._attn_implementation(device)
+            try:
+                self.model = self._from_pretrained(device, attn_implementation)
+            except (ImportError, ValueError) as e:
+                if attn_implementation == "sdpa":
+                    raise
+                self.logger.warning(f"{attn_implementation} unavailable, falling back to sdpa: {str(e)}")
+                self.model = self._from_pretrained(device, "sdpa")
+            if self.model.device.type == "cuda":
+                self._compile_model()
+            self._build_generation_configs()
+            for system_prompt in (_SYSTEM_KO_EN, _SYSTEM_EN_KO, _SYSTEM_GENERIC,
+                                  _SYSTEM_WORD_DIRECT, _SYSTEM_WORD_CONTEXT):
+                self._prompt_ids[system_prompt] = self._split_chat_template(system_prompt)
+            if self._cache_implementation is not None:
+                # self.model is already set, so a request may arrive during warm-up
+                with self._generate_lock:
+                    try:
+                        self._warm_up()
+                    except Exception as e:
+                        # Compilation is an optimization; never fail loading because of it
+                        self.logger.warning(f"Compiled warm-up failed, using eager mode: {str(e)}")
+                        self._disable_compile()
             self.logger.info("Model loaded successfully")
         except Exception as e:
             self.logger.error(f"Error loading model: {str(e)}")
             raise
 
+    def _from_pretrained(self, device: Optional[str], attn_implementation: str):
+        """Load the model weights with the given attention backend."""
+        quantization_config = self._quantization_config(device)
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            if torch.cuda.device_count() > 1:
+                device = "auto"
+
+        # device_map dispatch hooks every module, so use it only to shard or place quantized weights
+        device_map = None
+        if device == "auto" or quantization_config is not None:
+            device_map = device
+        model = AutoModelForCausalLM.from_pretrained(
+            self.model_name,
+            trust_remote_code=True,
+            revision="main",
+            torch_dtype=torch.bfloat16,
+            device_map=device_map,
+            low_cpu_mem_usage=True,
+            quantization_config=quantization_config,
+            attn_implementation=attn_implementation,
+        )
+        if device_map is None:
+            model = model.to(device)
+        return model.eval()
+
+    def _attn_implementation(self, device: Optional[str]) -> str:
+        """Pick FlashAttention-2 on Ampere or newer GPUs with flash_attn installed, else sdpa."""
+        if (device != "cpu" and torch.cuda.is_available()
+                and torch.cuda.get_device_capability()[0] >= 8
+                and importlib.util.find_spec("flash_attn") is not None):
+            return "flash_attention_2"
+        return "sdpa"
+
+    def _quantization_config(self, device: Optional[str]) -> Optional[BitsAndBytesConfig]:
+        """Return a bitsandbytes config when loading onto CUDA with bitsandbytes available."""
+        if self.quantization is None or device == "cpu" or not torch.cuda.is_available():
+            return None
+        if importlib.util.find_spec("bitsandbytes") is None:
+            self.logger.warning("bitsandbytes is not installed, loading the model in bfloat16")
+            return None
+        if self.quantization == "int8":
+            return BitsAndBytesConfig(load_in_8bit=True)
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=torch.bfloat16,
+        )
+
+    def _compile_model(self) -> None:
+        """Switch generation to a static KV cache so generate() compiles the decode step."""
+        # generate() compiles only the fixed-shape one-token decode step and runs
+        # the variable-length prefill eagerly, so new prompt lengths never recompile
+        self.logger.info("Compiling model for CUDA")
+        self._cache_implementation = "static"
+        self._compile_config = CompileConfig(fullgraph=True, mode="reduce-overhead")
+        self.model.generation_config.cache_implementation = self._cache_implementation
+
+    def _disable_compile(self) -> None:
+        """Undo _compile_model and fall back to eager forward with a dynamic cache."""
+        self._cache_implementation = None
+        self._compile_config = None
+        self.model.generation_config.cache_implementation = None
+        self._build_generation_configs()
+
+    def _warm_up(self) -> None:
+        """Run full-length generations so compilation and CUDA graph capture happen during loading."""
+        self.logger.info("Warming up compiled model")
+        input_ids = self._encode_chat(_SYSTEM_GENERIC, _WARM_UP_TEXT)
+        with torch.inference_mode():
+            for _ in range(2):
+                self.model.generate(
+                    self._to_device(input_ids),
+                    generation_config=self._gen_cfg_greedy,
+                    max_new_tokens=_MAX_NEW_TOKENS,
+                )
+
+    def _build_generation_configs(self) -> None:
+        """Build the immutable generation configs used by translate() and translate_word()."""
+        eos_token_id = self.tokenizer.eos_token_id
+        pad_token_id = self.tokenizer.pad_token_id
+        if pad_token_id is None:
+            pad_token_id = eos_token_id
+
+        self._gen_cfg_sample = GenerationConfig(
+            max_new_tokens=_MAX_NEW_TOKENS,  # Increased for better completions
+            do_sample=True,            # Enable sampling for more natural output
+            temperature=0.7,           # Add some randomness
+            top_p=0.95,                # Nucleus sampling
+            repetition_penalty=1.2,    # Prevent repetitive text
+            eos_token_id=eos_token_id,
+            pad_token_id=pad_token_id,
+            cache_implementation=self._cache_implementation,
+            compile_config=self._compile_config,
+            return_dict_in_generate=True,
+        )
+        # Fallback after a timeout: fewer tokens and greedy decoding for speed
+        self._gen_cfg_greedy = GenerationConfig(
+            max_new_tokens=_RETRY_MAX_NEW_TOKENS,
+            do_sample=False,
+            repetition_penalty=1.2,
+            eos_token_id=eos_token_id,
+            pad_token_id=pad_token_id,
+            cache_implementation=self._cache_implementation,
+            compile_config=self._compile_config,
+            return_dict_in_generate=True,
+        )
+        self._gen_cfg_word = GenerationConfig(
+            max_new_tokens=_WORD_MAX_NEW_TOKENS,
+            do_sample=False,
+            eos_token_id=eos_token_id,
+            pad_token_id=pad_token_id,
+            cache_implementation=self._cache_implementation,
+            compile_config=self._compile_config,
+            return_dict_in_generate=True,
+        )
+
+    def _to_device(self, tensor: torch.Tensor) -> torch.Tensor:
+        """Move a CPU tensor to the model's device, copying asynchronously from pinned memory on CUDA."""
+        device = self.model.device
+        if device.type == "cuda":
+            return tensor.pin_memory().to(device, non_blocking=True)
+        return tensor.to(device)
+
+    def _tokenize(self, text: str) -> torch.Tensor:
+        """Tokenize text without special tokens into a (1, n) tensor of ids."""
+        return torch.tensor([self.tokenizer.encode(text, add_special_tokens=False)], dtype=torch.long)
+
+    def _split_chat_template(self, system_prompt: str) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Tokenize the chat-template text before and after the user message."""
+        rendered = self.tokenizer.apply_chat_template(
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": _USER_PLACEHOLDER}
+            ],
+            tokenize=False,
+            add_generation_prompt=True
+        )
+        prefix, suffix = rendered.split(_USER_PLACEHOLDER)
+        return self._tokenize(prefix), self._tokenize(suffix)
+
+    def _template_ids(self, system_prompt: str) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Return the cached (prefix, suffix) template ids for a system prompt."""
+        template_ids = self._prompt_ids.get(system_prompt)
+        if template_ids is None:
+            template_ids = self._prompt_ids[system_prompt] = self._split_chat_template(system_prompt)
+        return template_ids
+
+    def _encode_chat(self, system_prompt: str, user_text: str) -> torch.Tensor:
+        """Build chat-template input ids, tokenizing only the user text per call."""
+        prefix_ids, suffix_ids = self._template_ids(system_prompt)
+        return torch.cat([prefix_ids, self._tokenize(user_text), suffix_ids], dim=1)
+
+    def _prefix_cache(self, system_prompt: str):
+        """Return a private copy of the cached KV prefix for a system prompt, or None with a static cache."""
+        if self._cache_implementation is not None:
+            return None
+        cache = self._prefix_kv.get(system_prompt)
+        if cache is None:
+            prefix_ids = self._template_ids(system_prompt)[0]
+            # no_grad rather than inference_mode: inference tensors could not be
+            # deep-copied below outside of inference mode
+            with torch.no_grad():
+                cache = self.model(
+                    input_ids=self._to_device(prefix_ids), use_cache=True
+                ).past_key_values
+            self._prefix_kv[system_prompt] = cache
+        # generate() extends the cache in place, so every call gets its own copy
+        return copy.deepcopy(cache)
+
     def generate_with_timeout(self, input_ids, timeout_seconds=30, **kwargs):
-        """Run model generation with timeout using a separate thread."""
-        result_queue = Queue()
-        error_queue = Queue()
+        """Run model generation, stopping it in-loop once the timeout has elapsed."""
+        # Only the compiled path shares state (one StaticCache and its CUDA graphs)
+        if self._cache_implementation == "static":
+            lock = self._generate_lock
+        else:
+            lock = contextlib.nullcontext()
+        with lock:
+            deadline = _Deadline(timeout_seconds)
+            with torch.inference_mode():
+                result = self.model.generate(
+                    self._to_device(input_ids),
+                    stopping_criteria=StoppingCriteriaList([deadline]),
+                    **kwargs
+                )
 
-        def generate_fn():
-            try:
-                with torch.no_grad():
-                    result = self.model.generate(input_ids.to(self.model.device), **kwargs)
-                result_queue.put(result)
-            except Exception as e:
-                error_queue.put(e)
-
-        # Start generation in a separate thread
-        thread = threading.Thread(target=generate_fn)
-        thread.daemon = True  # Thread will be killed if main program exits
-        thread.start()
-        
-        # Wait for the thread to complete or timeout
-        thread.join(timeout_seconds)
-        
-        if thread.is_alive():
-            # If thread is still running after timeout
+        if deadline.expired:
             self.logger.error("Generation timed out")
-            raise TimeoutException("Translation took too long. Please try again with shorter text.")
-        
-        # Check for errors
-        if not error_queue.empty():
-            raise error_queue.get()
-        
-        # Get the result
-        if not result_queue.empty():
-            return result_queue.get()
-        else:
-            raise TimeoutException("No result produced within timeout period")
+            raise TimeoutException(
+                "Translation took too long. Please try again with shorter text.",
+                partial=result
+            )
 
-    def translate(self, text: str, max_length: int = 256) -> str:
-        """Perform translation using the loaded model."""
+        return result
+
+    def translate(self, text: str, max_length: int = 256,
+                  on_text: Optional[Callable[[str], None]] = None,
+                  direction: Optional[str] = None) -> str:
+        """Perform translation using the loaded model, streaming chunks to on_text if given."""
         if self.model is None or self.tokenizer is None:
             raise RuntimeError("Model and tokenizer must be loaded before translation")
         
         try:
-            self.logger.info("Preparing chat template")
-            
-            # Determine translation direction and create appropriate system message
-            if "Translate this Korean text to English:" in text or "ko" in text:
-                system_content = (
-                    "You are EXAONE model from LG AI Research. "
-                    "You are a professional Korean to English translator. "
-                    "Translate the following Korean text to natural, fluent English. "
-                    "Maintain the original meaning and nuance."
-                )
-                text = text.replace("Translate this Korean text to English:", "").strip()
-            elif "Translate this English text to Korean:" in text or "en" in text:
-                system_content = (
-                    "You are EXAONE model from LG AI Research. "
-                    "You are a professional English to Korean translator. "
-                    "Translate the following English text to natural, fluent Korean. "
-                    "Maintain the original meaning and nuance."
-                )
-                text = text.replace("Translate this English text to Korean:", "").strip()
+            self.logger.info("Starting translation")
+
+            # Determine translation direction ("ko2en"/"en2ko", or a legacy text marker)
+            if direction is not None:
+                system_content = _DIRECTIONS.get(direction, _SYSTEM_GENERIC)
+                text = text.strip()
             else:
-                system_content = (
-                    "You are EXAONE model from LG AI Research. "
-                    "Translate the following text appropriately while maintaining "
-                    "the original meaning and nuance."
-                )
+                system_content, text = self._parse_direction_marker(text)
 
-            # Create messages for chat template
-            messages = [
-                {"role": "system", "content": system_content},
-                {"role": "user", "content": text}
-            ]
-            
-            self.logger.info("Applying chat template...")
-            input_ids = self.tokenizer.apply_chat_template(
-                messages,
-                tokenize=True,
-                add_generation_prompt=True,
-                return_tensors="pt"
-            )
-            self.logger.info("Chat template applied")
-            
-            self.logger.info("Starting model generation")
-            generation_args = {
-                "max_new_tokens": 256,        # Increased for better completions
-                "do_sample": True,            # Enable sampling for more natural output
-                "temperature": 0.7,           # Add some randomness
-                "top_p": 0.95,               # Nucleus sampling
-                "eos_token_id": self.tokenizer.eos_token_id,
-                "pad_token_id": self.tokenizer.pad_token_id if hasattr(self.tokenizer, 'pad_token_id') else self.tokenizer.eos_token_id,
-                "repetition_penalty": 1.2     # Prevent repetitive text
-            }
-            
-            # Try generation with timeout
-            try:
-                outputs = self.generate_with_timeout(input_ids, timeout_seconds=30, **generation_args)
-                self.logger.info("Model generation completed")
-            except TimeoutException:
-                # If first attempt times out, try with shorter max_tokens
-                self.logger.warning("First attempt timed out, trying with reduced tokens")
-                generation_args["max_new_tokens"] = 128
-                generation_args["do_sample"] = False  # Switch to greedy decoding for faster generation
-                outputs = self.generate_with_timeout(input_ids, timeout_seconds=15, **generation_args)
-            
-            self.logger.info("Starting decoding")
-            translation = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-            
-            # Clean up translation by removing the input text and assistant prefix
-            try:
-                # Remove the input text first
-                if text in translation:
-                    translation = translation.split(text)[-1].strip()
-                # Remove the assistant prefix if present
-                if "[|assistant|]" in translation:
-                    translation = translation.split("[|assistant|]")[-1].strip()
-                # Remove any remaining system message fragments
-                if "You are EXAONE model" in translation:
-                    translation = translation.split("You are EXAONE model")[0].strip()
-            except:
-                pass
-            
-            self.logger.info("Decoding completed")
-            self.logger.info(f"Raw translation: {translation}")
-            
+            translation = self._translate_single(system_content, text, on_text)
+            self.logger.info("Translation finished")
             return translation
         except TimeoutException as te:
             self.logger.error("Translation timed out")
@@ -167,53 +379,82 @@ class TranslationModel:
             self.logger.error(f"Translation error: {str(e)}")
             raise
 
+    @staticmethod
+    def _parse_direction_marker(text: str) -> Tuple[str, str]:
+        """Return the system prompt and the remaining text for a marker-prefixed prompt."""
+        for prefix, system_content in _PREFIX_TABLE:
+            if text.startswith(prefix):
+                return system_content, text[len(prefix):].strip()
+        if "ko" in text:
+            return _SYSTEM_KO_EN, text
+        if "en" in text:
+            return _SYSTEM_EN_KO, text
+        return _SYSTEM_GENERIC, text
+
+    def _translate_single(self, system_content: str, text: str,
+                          on_text: Optional[Callable[[str], None]] = None) -> str:
+        """Translate one text, continuing greedily if the first attempt times out."""
+        input_ids = self._encode_chat(system_content, text)
+
+        # One streamer serves both attempts: it skips each call's prompt, so a
+        # retry keeps streaming from where the first attempt stopped.
+        streamer = _CallbackStreamer(self.tokenizer, on_text) if on_text is not None else None
+        # Try generation with timeout
+        try:
+            outputs = self.generate_with_timeout(
+                input_ids, timeout_seconds=30,
+                generation_config=self._gen_cfg_sample, streamer=streamer,
+                past_key_values=self._prefix_cache(system_content)
+            )
+        except TimeoutException as timeout:
+            # If first attempt times out, continue greedily with fewer tokens from
+            # where it stopped. Its KV cache already covers the prompt and the
+            # tokens generated so far, so the retry skips the prefill pass.
+            self.logger.warning("First attempt timed out, trying with reduced tokens")
+            partial = timeout.partial
+            # A static cache is owned and reset by generate() itself
+            past_key_values = None if self._cache_implementation == "static" else partial.past_key_values
+            outputs = self.generate_with_timeout(
+                partial.sequences, timeout_seconds=15,
+                generation_config=self._gen_cfg_greedy, past_key_values=past_key_values,
+                streamer=streamer
+            )
+
+        if streamer is not None:
+            # The streamer has already decoded every generated token
+            translation = "".join(streamer.chunks).strip()
+        else:
+            # Decode only the generated tokens (including any produced by the retry),
+            # so no prompt text has to be split back out of the result.
+            new_tokens = outputs.sequences[0, input_ids.shape[1]:]
+            translation = self.tokenizer.decode(new_tokens, skip_special_tokens=True).strip()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Raw translation: %s", translation)
+        return translation
+
+    def _one_shot(self, system_prompt: str, user_text: str, timeout_seconds: float) -> str:
+        """Run a single short greedy exchange and return only the model's reply."""
+        input_ids = self._encode_chat(system_prompt, user_text)
+        outputs = self.generate_with_timeout(
+            input_ids, timeout_seconds=timeout_seconds, generation_config=self._gen_cfg_word,
+            past_key_values=self._prefix_cache(system_prompt)
+        )
+        # Decode only the generated tokens rather than the whole prompt + reply
+        new_tokens = outputs.sequences[0, input_ids.shape[1]:]
+        return self.tokenizer.decode(new_tokens, skip_special_tokens=True).strip()
+
     def translate_word(self, word: str, context: str = None) -> dict:
         """Translate a single word with both direct and contextual translations."""
         try:
             # Get direct translation first
-            messages_direct = [
-                {"role": "system", "content": "You are EXAONE model from LG AI Research. Provide a direct word-for-word translation."},
-                {"role": "user", "content": word}
-            ]
-            
-            input_ids_direct = self.tokenizer.apply_chat_template(
-                messages_direct,
-                tokenize=True,
-                add_generation_prompt=True,
-                return_tensors="pt"
-            )
-            
-            generation_args = {
-                "max_new_tokens": 32,
-                "do_sample": False,
-                "eos_token_id": self.tokenizer.eos_token_id,
-            }
-            
-            outputs_direct = self.generate_with_timeout(input_ids_direct, timeout_seconds=5, **generation_args)
-            direct_translation = self.tokenizer.decode(outputs_direct[0], skip_special_tokens=True)
-            if "[|assistant|]" in direct_translation:
-                direct_translation = direct_translation.split("[|assistant|]")[-1].strip()
+            direct_translation = self._one_shot(_SYSTEM_WORD_DIRECT, word, timeout_seconds=5)
             
             # Get contextual translation if context is provided
             contextual_translation = None
             if context:
-                messages_context = [
-                    {"role": "system", "content": "You are EXAONE model from LG AI Research. "
-                     "Explain how this word is used in the given context and provide its contextual meaning."},
-                    {"role": "user", "content": f"Word: {word}\nContext: {context}"}
-                ]
-                
-                input_ids_context = self.tokenizer.apply_chat_template(
-                    messages_context,
-                    tokenize=True,
-                    add_generation_prompt=True,
-                    return_tensors="pt"
+                contextual_translation = self._one_shot(
+                    _SYSTEM_WORD_CONTEXT, f"Word: {word}\nContext: {context}", timeout_seconds=10
                 )
-                
-                outputs_context = self.generate_with_timeout(input_ids_context, timeout_seconds=10, **generation_args)
-                contextual_translation = self.tokenizer.decode(outputs_context[0], skip_special_tokens=True)
-                if "[|assistant|]" in contextual_translation:
-                    contextual_translation = contextual_translation.split("[|assistant|]")[-1].strip()
             
             return {
                 "word": word,
@@ -229,10 +470,18 @@ class TranslationModel:
         """Cleanup method to free GPU memory."""
         try:
             if self.model is not None:
+                # Drop the weights now rather than whenever the last reference goes;
+                # bitsandbytes-quantized models do not support .to()
+                if getattr(self.model, "hf_quantizer", None) is None:
+                    self.model.to("meta")
                 del self.model
             if self.tokenizer is not None:
                 del self.tokenizer
-            torch.cuda.empty_cache()
+            self._prefix_kv.clear()
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+                torch.cuda.ipc_collect()
         except Exception as e:
             if self.logger:
                 self.logger.warning(f"Error during cleanup: {str(e)}")
@@ -11,14 +11,22 @@ def test_translation():
         logger.info("Loading model and tokenizer...")
         model_name = "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct"
         tokenizer = AutoTokenizer.from_pretrained(model_name, trust_remote_code=True)
-        model = AutoModelForCausalLM.from_pretrained(
-            model_name,
+        load_kwargs = dict(
             trust_remote_code=True,
             revision="main",
             torch_dtype=torch.bfloat16,
             device_map="auto",
             low_cpu_mem_usage=True,
         )
+        try:
+            model = AutoModelForCausalLM.from_pretrained(
+                model_name, attn_implementation="flash_attention_2", **load_kwargs
+            )
+        except (ImportError, ValueError):
+            logger.info("FlashAttention-2 unavailable, using sdpa attention")
+            model = AutoModelForCausalLM.from_pretrained(
+                model_name, attn_implementation="sdpa", **load_kwargs
+            )
         logger.info("Model loaded successfully")
 
         # Test texts
@@ -1,37 +1,123 @@
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QTextEdit, QLabel, QPushButton, QToolTip,
-                             QProgressBar, QFrame)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread
+                             QProgressBar, QFrame, QGraphicsOpacityEffect)
+from PyQt6.QtCore import Qt, QEvent, QTimer, pyqtSignal, QObject, QRunnable, QPropertyAnimation
 from PyQt6.QtGui import QTextCursor, QFont, QPalette, QColor, QCursor
+import re
 import sys
-from typing import Optional, Tuple
+from functools import partial
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# (source_lang, target_lang) -> TranslationModel.translate() direction
+_DIRECTIONS = {
+    ("ko", "en"): "ko2en",
+    ("en", "ko"): "en2ko",
+}
+
+# Script detection for inputs that need no translation
+_HANGUL_RE = re.compile(r"[\uac00-\ud7af]")
+_LATIN_RE = re.compile(r"[A-Za-z]")
+_NO_LETTERS_RE = re.compile(r"[\d\s\W_]+")
+_WORD_RE = re.compile(r"\w+")
+
+# Application style sheet, set once on the QApplication and matched by object name
+_APP_QSS = """
+    QFrame#loadingContainer, #loadingContainer QFrame {
+        background-color: white;
+        border-radius: 10px;
+        padding: 20px;
+    }
+    QLabel#loadingLabel {
+        color: #333;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QProgressBar#loadingProgress {
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #f5f5f5;
+    }
+    QProgressBar#loadingProgress::chunk {
+        background-color: #4CAF50;
+        border-radius: 3px;
+    }
+    QPushButton#koToEnBtn, QPushButton#enToKoBtn {
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-size: 14px;
+        min-width: 150px;
+    }
+    QPushButton#koToEnBtn {
+        background-color: #4CAF50;
+    }
+    QPushButton#koToEnBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#koToEnBtn:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton#enToKoBtn {
+        background-color: #2196F3;
+    }
+    QPushButton#enToKoBtn:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#enToKoBtn:pressed {
+        background-color: #1565C0;
+    }
+"""
+
+# Shared font and palette, built on first use
+_TOOLTIP_FONT = None
+_OVERLAY_PALETTE = None
+
+def _tooltip_font():
+    """Return the word tooltip font."""
+    global _TOOLTIP_FONT
+    if _TOOLTIP_FONT is None:
+        _TOOLTIP_FONT = QFont('SansSerif', 10)
+    return _TOOLTIP_FONT
+
+def _overlay_palette():
+    """Return the loading overlay's semi-transparent black background palette."""
+    global _OVERLAY_PALETTE
+    if _OVERLAY_PALETTE is None:
+        palette = QPalette()
+        palette.setColor(QPalette.ColorRole.Window, QColor(0, 0, 0, 128))
+        _OVERLAY_PALETTE = palette
+    return _OVERLAY_PALETTE
+
 class LoadingOverlay(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._last_parent_size = None  # Parent size the overlay was last fitted to
         self.setup_ui()
+        # Shown once and then faded in and out, so hiding it never invalidates layout
+        self._active = False
+        self._opacity = QGraphicsOpacityEffect(self)
+        self._opacity.setOpacity(0.0)
+        self.setGraphicsEffect(self._opacity)
+        self._fade = QPropertyAnimation(self._opacity, b"opacity", self)
+        self._fade.setDuration(150)
         self.hide()
+        if parent is not None:
+            parent.installEventFilter(self)
 
     def setup_ui(self):
         """Setup the loading overlay UI."""
         # Set up the semi-transparent background
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(0, 0, 0, 128))
         self.setAutoFillBackground(True)
-        self.setPalette(palette)
+        self.setPalette(_overlay_palette())
 
         # Create a container for the loading elements with white background
         self.container = QFrame(self)
-        self.container.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 10px;
-                padding: 20px;
-            }
-        """)
+        self.container.setObjectName("loadingContainer")
         self.container.setFixedSize(300, 150)
 
         # Layout for the container
@@ -41,33 +127,16 @@ class LoadingOverlay(QWidget):
 
         # Loading label
         self.loading_label = QLabel("Loading Model...")
-        self.loading_label.setStyleSheet("""
-            QLabel {
-                color: #333;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.loading_label.setObjectName("loadingLabel")
         self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Progress bar
         self.progress_bar = QProgressBar()
-        self.progress_bar.setMinimum(0)
-        self.progress_bar.setMaximum(0)  # Indeterminate progress
+        # Indeterminate (busy) only while active, so no animation runs in between
+        self.progress_bar.setRange(0, 1)
         self.progress_bar.setFixedWidth(250)
         self.progress_bar.setFixedHeight(8)  # Make it thinner
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #f5f5f5;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setObjectName("loadingProgress")
 
         # Add widgets to container layout
         container_layout.addWidget(self.loading_label)
@@ -78,22 +147,52 @@ class LoadingOverlay(QWidget):
         main_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(self.container)
 
-    def resizeEvent(self, event):
-        """Ensure overlay covers the entire parent widget and centers the container."""
-        if self.parent():
-            self.resize(self.parent().size())
-            # Center the container
-            container_x = (self.width() - self.container.width()) // 2
-            container_y = (self.height() - self.container.height()) // 2
-            self.container.move(container_x, container_y)
-        super().resizeEvent(event)
-
-class TranslationWorker(QThread):
-    finished = pyqtSignal(str)
+    def set_active(self, active: bool):
+        """Fade the overlay in or out; while faded out it lets mouse events through."""
+        if active == self._active:
+            return
+        self._active = active
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, not active)
+        if active:
+            self.progress_bar.setRange(0, 0)
+        else:
+            self.progress_bar.setRange(0, 1)
+            self.progress_bar.setValue(1)
+        self._fade.stop()
+        self._fade.setStartValue(self._opacity.opacity())
+        self._fade.setEndValue(1.0 if active else 0.0)
+        self._fade.start()
+
+    def eventFilter(self, obj, event):
+        """Follow the parent's size; the layout keeps the container centered."""
+        if obj is self.parent() and event.type() == QEvent.Type.Resize and self.isVisible():
+            self._fit_to_parent()
+        return super().eventFilter(obj, event)
+
+    def showEvent(self, event):
+        """Catch up on parent resizes that happened while hidden."""
+        self._fit_to_parent()
+        super().showEvent(event)
+
+    def _fit_to_parent(self):
+        """Cover the entire parent widget."""
+        parent = self.parent()
+        if parent and parent.size() != self._last_parent_size:
+            self._last_parent_size = parent.size()
+            self.setGeometry(parent.rect())
+
+class TranslationSignals(QObject):
+    """Signals of a TranslationRunnable, which is not a QObject itself."""
+    finished = pyqtSignal(object)  # str; passed by reference instead of converted to a QString
     error = pyqtSignal(str)
+    partial = pyqtSignal(str)  # chunk of the translation as it is generated
     manual_translation_requested = pyqtSignal(str, str, str)  # text, source_lang, target_lang
+
+class TranslationRunnable(QRunnable):
+    """Runs one translation on a pooled thread instead of a thread of its own."""
     def __init__(self, model, text: str, source_lang: str, target_lang: str):
         super().__init__()
+        self.signals = TranslationSignals()
         self.model = model
         self.text = text
         self.source_lang = source_lang
@@ -102,24 +201,41 @@ class TranslationWorker(QThread):
 
     def run(self):
         try:
-            self.logger.info(f"Translation worker starting: {self.text[:50]}...")
-            self.logger.info(f"Source lang: {self.source_lang}, Target lang: {self.target_lang}")
-            
-            # Add prompt based on direction
-            if self.source_lang == "ko" and self.target_lang == "en":
-                prompt = f"Translate this Korean text to English: {self.text}"
-            else:
-                prompt = f"Translate this English text to Korean: {self.text}"
-            
-            self.logger.info("Calling model.translate")
-            translation = self.model.translate(prompt)
-            self.logger.info(f"Translation completed: {translation[:50]}...")
+            log_info = self.logger.isEnabledFor(logging.INFO)
+            if log_info:
+                self.logger.info(f"Translation worker starting: {self.text[:50]}...")
+                self.logger.info(f"Source lang: {self.source_lang}, Target lang: {self.target_lang}")
+
+            direction = _DIRECTIONS.get((self.source_lang, self.target_lang), "en2ko")
+
+            if log_info:
+                self.logger.info("Calling model.translate")
+            translation = self.model.translate(self.text, on_text=self.signals.partial.emit, direction=direction)
+            if log_info:
+                self.logger.info(f"Translation completed: {translation[:50]}...")
             
-            self.finished.emit(translation)
+            self.signals.finished.emit(translation)
             
         except Exception as e:
             self.logger.error(f"Error in translation worker: {str(e)}")
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+class WordTranslationRunnable(QRunnable):
+    """Runs one word lookup on a pooled thread, off the GUI thread."""
+    def __init__(self, model, word: str, context: str):
+        super().__init__()
+        self.signals = TranslationSignals()
+        self.model = model
+        self.word = word
+        self.context = context
+        self.logger = logging.getLogger(__name__)
+
+    def run(self):
+        try:
+            self.signals.finished.emit(self.model.translate_word(self.word, self.context))
+        except Exception as e:
+            self.logger.error(f"Error in word translation worker: {str(e)}")
+            self.signals.error.emit(str(e))
 
 class TranslatorWidget(QWidget):
     translation_requested = pyqtSignal(str, str, str)  # text, source_lang, target_lang
@@ -130,6 +246,17 @@ class TranslatorWidget(QWidget):
         self.init_ui()
         self.loading_overlay = LoadingOverlay(self)
         self.last_translation = {"source": "", "target": ""}  # Store last translation for context
+        self._streaming = False  # True while streamed chunks are being appended
+        # (lowercased word, context) -> word translation for the current translation pair
+        self._word_cache = {}
+        # (selected text, context) of the last word translation request
+        self._last_sel = (None, None)
+        # Selection changes are collapsed into one word lookup once the selection settles
+        self._pending_editor: Optional[QTextEdit] = None
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.setInterval(200)
+        self._sel_timer.timeout.connect(self._emit_pending_selection, Qt.ConnectionType.DirectConnection)
 
     def init_ui(self):
         """Initialize the UI components."""
@@ -140,7 +267,6 @@ class TranslatorWidget(QWidget):
         korean_layout = QVBoxLayout()
         korean_label = QLabel("Korean Text")
         self.korean_editor = QTextEdit()
-        self.korean_editor.setMouseTracking(True)  # Enable mouse tracking for hover
         korean_layout.addWidget(korean_label)
         korean_layout.addWidget(self.korean_editor)
         
@@ -151,43 +277,11 @@ class TranslatorWidget(QWidget):
         
         # Ko->En button
         self.ko_to_en_button = QPushButton("한국어 → English")
-        self.ko_to_en_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 14px;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        self.ko_to_en_button.setObjectName("koToEnBtn")
         
         # En->Ko button
         self.en_to_ko_button = QPushButton("English → 한국어")
-        self.en_to_ko_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 14px;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #1565C0;
-            }
-        """)
+        self.en_to_ko_button.setObjectName("enToKoBtn")
         
         buttons_layout.addStretch()
         buttons_layout.addWidget(self.ko_to_en_button)
@@ -198,7 +292,6 @@ class TranslatorWidget(QWidget):
         english_layout = QVBoxLayout()
         english_label = QLabel("English Text")
         self.english_editor = QTextEdit()
-        self.english_editor.setMouseTracking(True)  # Enable mouse tracking for hover
         english_layout.addWidget(english_label)
         english_layout.addWidget(self.english_editor)
         
@@ -218,76 +311,179 @@ class TranslatorWidget(QWidget):
         self.setLayout(main_layout)
         
         # Connect button signals
-        self.ko_to_en_button.clicked.connect(self.on_ko_to_en_clicked)
-        self.en_to_ko_button.clicked.connect(self.on_en_to_ko_clicked)
+        self.ko_to_en_button.clicked.connect(self.on_ko_to_en_clicked, Qt.ConnectionType.DirectConnection)
+        self.en_to_ko_button.clicked.connect(self.on_en_to_ko_clicked, Qt.ConnectionType.DirectConnection)
         
         # Connect text selection signals
-        self.korean_editor.selectionChanged.connect(lambda: self.handle_text_selection(self.korean_editor))
-        self.english_editor.selectionChanged.connect(lambda: self.handle_text_selection(self.english_editor))
+        self.korean_editor.selectionChanged.connect(
+            partial(self._on_selection_changed, self.korean_editor), Qt.ConnectionType.DirectConnection
+        )
+        self.english_editor.selectionChanged.connect(
+            partial(self._on_selection_changed, self.english_editor), Qt.ConnectionType.DirectConnection
+        )
         
         # Setup tooltip
-        QToolTip.setFont(QFont('SansSerif', 10))
+        QToolTip.setFont(_tooltip_font())
+
+    def _on_selection_changed(self, editor):
+        """Restart the selection debounce; only the last change in a burst is handled."""
+        self._pending_editor = editor
+        self._sel_timer.start()
+
+    def _emit_pending_selection(self):
+        """Handle the selection once it has stopped changing."""
+        editor, self._pending_editor = self._pending_editor, None
+        if editor is not None:
+            self.handle_text_selection(editor)
 
     def handle_text_selection(self, editor):
         """Handle text selection in either editor."""
         cursor = editor.textCursor()
-        if cursor.hasSelection():
-            selected_text = cursor.selectedText()
-            if selected_text.strip():
-                # Determine which editor was used and get appropriate context
-                if editor == self.korean_editor:
-                    context = self.last_translation.get("source", "")
-                else:
-                    context = self.last_translation.get("target", "")
-                
-                # Emit signal for word translation
-                self.word_translation_requested.emit(selected_text, context)
+        if not cursor.hasSelection():
+            # A later selection of the same text is a new request
+            self._last_sel = (None, None)
+            return
+        selected_text = cursor.selectedText()
+        if selected_text.strip():
+            # Determine which editor was used and get appropriate context
+            if editor == self.korean_editor:
+                context = self.last_translation.get("source", "")
+            else:
+                context = self.last_translation.get("target", "")
+
+            cached = self._word_cache.get((selected_text.strip().lower(), context))
+            if cached is not None:
+                self.show_word_translation(cached)
+                return
+
+            # Skip reports of a selection that is still the same text
+            key = (selected_text, context)
+            if key == self._last_sel:
+                return
+
+            # Emit signal for word translation
+            self.word_translation_requested.emit(selected_text, context)
+            self._last_sel = key
 
     def show_word_translation(self, translations: dict):
         """Show word translation in a tooltip."""
         if not translations:
             return
             
-        tooltip_text = f"Direct Translation: {translations['direct_translation']}\n"
-        if translations.get('contextual_translation'):
-            tooltip_text += f"\nContextual Meaning:\n{translations['contextual_translation']}"
-        
-        # Show tooltip near the cursor
-        cursor_pos = self.mapFromGlobal(QCursor.pos())
-        QToolTip.showText(self.mapToGlobal(cursor_pos), tooltip_text)
+        parts = ["Direct Translation: ", translations['direct_translation'], "\n"]
+        contextual_translation = translations.get('contextual_translation')
+        if contextual_translation:
+            parts += ["\nContextual Meaning:\n", contextual_translation]
+
+        # Show tooltip at the cursor; QCursor.pos() is already in global coordinates
+        QToolTip.showText(QCursor.pos(), "".join(parts))
 
     def on_ko_to_en_clicked(self):
         """Handle Korean to English translation."""
+        if self._document_is_blank(self.korean_editor.document()):
+            return
         text = self.korean_editor.toPlainText()
-        if text.strip():
-            self.last_translation["source"] = text
-            self.translation_requested.emit(text, "ko", "en")
+        self.last_translation["source"] = text
+        self._request_translation(text, "ko", "en")
 
     def on_en_to_ko_clicked(self):
         """Handle English to Korean translation."""
+        if self._document_is_blank(self.english_editor.document()):
+            return
         text = self.english_editor.toPlainText()
-        if text.strip():
-            self.last_translation["source"] = text
-            self.translation_requested.emit(text, "en", "ko")
+        self.last_translation["source"] = text
+        self._request_translation(text, "en", "ko")
+
+    @staticmethod
+    def _document_is_blank(document) -> bool:
+        """Return whether a document holds only whitespace, without copying its text out."""
+        # An empty document still counts its trailing paragraph separator
+        if document.characterCount() <= 1:
+            return True
+        block = document.begin()
+        while block.isValid():
+            if block.text().strip():
+                return False
+            block = block.next()
+        return True
+
+    def _request_translation(self, text: str, source_lang: str, target_lang: str):
+        """Show input that needs no translation right away, or ask for a translation."""
+        translation = self._should_short_circuit(text, source_lang, target_lang)
+        if translation is not None:
+            self.show_translation(translation, target_lang)
+            return
+        self.translation_requested.emit(text, source_lang, target_lang)
+
+    @staticmethod
+    def _should_short_circuit(text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Return the text itself when it needs no translation, otherwise None."""
+        # Blank text, text without letters, or text already entirely in the target script
+        stripped = text.strip()
+        if not stripped or _NO_LETTERS_RE.fullmatch(stripped):
+            return text
+        has_hangul = _HANGUL_RE.search(stripped) is not None
+        has_latin = _LATIN_RE.search(stripped) is not None
+        if target_lang == "ko" and has_hangul and not has_latin:
+            return text
+        if target_lang == "en" and has_latin and not has_hangul:
+            return text
+        return None
+
+    def append_translation_chunk(self, chunk: str, target_lang: str):
+        """Append a streamed chunk of an in-progress translation to the target editor."""
+        editor = self.english_editor if target_lang == "en" else self.korean_editor
+        if not self._streaming:
+            editor.clear()
+            self._streaming = True
+        cursor = editor.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
 
     def show_translation(self, text: str, target_lang: str):
         """Display translation in the appropriate editor."""
-        if target_lang == "en":
-            self.english_editor.setText(text)
-            self.last_translation["target"] = text
-        else:
-            self.korean_editor.setText(text)
-            self.last_translation["target"] = text
+        self._streaming = False
+        editor = self.english_editor if target_lang == "en" else self.korean_editor
+        # Replace the plain text as one update, without intermediate signals or repaints
+        editor.setUpdatesEnabled(False)
+        editor.blockSignals(True)
+        try:
+            editor.setPlainText(text)
+        finally:
+            editor.blockSignals(False)
+            editor.setUpdatesEnabled(True)
+        editor.viewport().update()
+        self.last_translation["target"] = text
+        self._reset_word_cache(self.last_translation["source"], text)
+
+    def _reset_word_cache(self, source: str, target: str):
+        """Start a fresh word cache, preloaded with words that appear unchanged in both texts."""
+        source_words = {word.lower(): word for word in _WORD_RE.findall(source)}
+        target_words = {word.lower(): word for word in _WORD_RE.findall(target)}
+        self._word_cache = {}
+        for key in source_words.keys() & target_words.keys():
+            # Each side shows the word as it is written in the other text
+            self._word_cache[(key, source)] = {
+                "word": source_words[key], "direct_translation": target_words[key], "contextual_translation": None
+            }
+            self._word_cache[(key, target)] = {
+                "word": target_words[key], "direct_translation": source_words[key], "contextual_translation": None
+            }
+
+    def remember_word_translation(self, word: str, context: str, translations: dict):
+        """Keep a word translation for its context until the next translation is shown."""
+        self._word_cache[(word.strip().lower(), context)] = translations
 
     def show_loading(self, message: str = "Loading Model..."):
         """Show the loading overlay."""
         self.loading_overlay.loading_label.setText(message)
+        self.loading_overlay.set_active(True)
         self.loading_overlay.show()
         self.loading_overlay.raise_()
 
     def hide_loading(self):
         """Hide the loading overlay."""
-        self.loading_overlay.hide()
+        self.loading_overlay.set_active(False)
 
 class TranslatorWindow(QMainWindow):
     def __init__(self):
@@ -297,6 +493,7 @@ class TranslatorWindow(QMainWindow):
     def init_ui(self):
         """Initialize the main window UI."""
         self.setWindowTitle('Korean-English Translator')
+        QApplication.instance().setStyleSheet(_APP_QSS)
         self.setGeometry(100, 100, 1200, 800)
         
         # Create central widget